@@ -70,12 +70,13 @@ and the matching mass spectrum extracted from the LC-MS data (:attr:`~.Compound.
 # stdlib
 import datetime
 import re
+from functools import lru_cache
 from pprint import pformat
-from typing import Dict, Iterable, List, Optional, Sequence, Type, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, Union
 
 # 3rd party
 import attr
-import lxml.objectify  # type: ignore
+import lxml.etree  # type: ignore
 from attr_utils.docstrings import add_attrs_doc
 from attr_utils.serialise import serde
 from chemistry_tools.formulae import Formula
@@ -104,10 +105,52 @@ __all__ = [
 		"Compound",
 		"CompoundList",
 		"parse_cef",
+		"iter_cef",
 		]
 
+_VOLTAGE_RE = re.compile(r"([0-9]+\.?[0-9]*)")
 
-class Molecule(Dictable):
+_POLARITY_MAP: Dict[Union[str, int], int] = {
+		'+': 1,
+		1: 1,
+		'1': 1,
+		"positive": 1,
+		'-': -1,
+		-1: -1,
+		"-1": -1,
+		"negative": -1,
+		}
+
+
+@lru_cache(maxsize=4096)
+def _parse_formula(formula: str) -> Formula:
+	return Formula.from_string(formula)
+
+
+def _to_formula(formula: Union[str, Formula, None]) -> Formula:
+	if isinstance(formula, Formula):
+		return formula
+	elif formula is not None:
+		# Formula objects are mutable, so hand out a copy of the cached parse.
+		cached = _parse_formula(formula)
+		return Formula(cached, charge=cached.charge)
+	else:
+		return Formula()
+
+
+def _to_matches(matches: Optional[Dict[str, "Score"]]) -> Dict[str, "Score"]:
+	if isinstance(matches, dict):
+		return matches
+	elif matches is None:
+		return {}
+	else:
+		raise TypeError(f"'matches' must be a dictionary, not {type(matches)}")
+
+
+@serde
+@add_attrs_doc
+@attr.s(slots=True, repr=False)
+class Molecule:
 	"""
 	Represents a molecule in a CEF file.
 
@@ -118,40 +161,25 @@ class Molecule(Dictable):
 	:param matches: Dictionary of algo: score match values.
 	"""
 
-	def __init__(
-			self,
-			name: str,
-			formula: Union[str, Formula, None] = None,
-			matches: Optional[Dict[str, "Score"]] = None,
-			):
+	name: str = attr.ib(converter=str)
+	formula: Formula = attr.ib(converter=_to_formula, default=None)
+	matches: Dict[str, "Score"] = attr.ib(converter=_to_matches, default=None)
 
-		super().__init__()
+	def __copy__(self) -> "Molecule":
+		return self.__class__(self.name, self.formula, self.matches)
 
-		self.name = str(name)
-		if isinstance(formula, Formula):
-			self.formula = formula
-		elif formula is not None:
-			self.formula = Formula.from_string(formula)
-		else:
-			self.formula = Formula()
+	def __deepcopy__(self, memodict={}) -> "Molecule":
+		return self.__copy__()
 
-		if isinstance(matches, dict):
-			self.matches = matches
-		elif matches is None:
-			self.matches = {}
-		else:
-			raise TypeError(f"'matches' must be a dictionary, not {type(matches)}")
+	def __iter__(self) -> Iterator[Tuple[str, Any]]:
+		"""
+		Iterate over the attributes of the class.
+		"""
 
-	@property
-	def __dict__(self):
-		return dict(
-				name=self.name,
-				formula=self.formula,
-				matches=self.matches,
-				)
+		yield from attr.asdict(self, recurse=False).items()
 
 	@classmethod
-	def from_xml(cls, element: lxml.objectify.ObjectifiedElement) -> "Molecule":
+	def from_xml(cls, element: lxml.etree._Element) -> "Molecule":
 		"""
 		Construct a :class:`~.Molecule` object from an XML element.
 
@@ -161,7 +189,7 @@ class Molecule(Dictable):
 		return cls(
 				name=element.attrib["name"],
 				formula=element.attrib["formula"],
-				matches=parse_match_scores(element.MatchScores),
+				matches=parse_match_scores(element.find("MatchScores")),
 				)
 
 	def __repr__(self) -> str:
@@ -192,7 +220,7 @@ class Device:
 	number: int = attr.ib(converter=int)
 
 	@classmethod
-	def from_xml(cls, element: lxml.objectify.ObjectifiedElement) -> "Device":
+	def from_xml(cls, element: lxml.etree._Element) -> "Device":
 		"""
 		Construct a :class:`~.Device` object from an XML element.
 
@@ -219,20 +247,50 @@ class Peak:
 	label: str = attr.ib(converter=str, default='')  #: The label of the peak. e.g. "M+H"
 
 	@classmethod
-	def from_xml(cls, element: lxml.objectify.ObjectifiedElement) -> "Peak":
+	def from_xml(cls, element: lxml.etree._Element) -> "Peak":
 		"""
 		Construct a :class:`~.Peak` object from an XML element.
 
 		:param element: a ``<p>`` XML element from an <MSPeaks> element of a CEF file
 		"""
 
-		data = dict(element.attrib)
-		data["charge"] = data.pop('z', 0)
-		data["label"] = data.pop('s', '')
-		return cls(**data)
+		attrib = element.attrib
+		return cls(attrib['x'], attrib["rx"], attrib['y'], attrib.get('z', 0), attrib.get('s', ''))
+
+
+def _to_voltage(voltage: Union[str, float]) -> float:
+	if isinstance(voltage, str):
+		m = _VOLTAGE_RE.match(voltage)
+		if m is not None and m.group(1):
+			return float(m.group(1))
+		else:
+			return 0
+	else:
+		return float(voltage)
+
+
+def _to_polarity(polarity: Union[str, int]) -> int:
+	p = _POLARITY_MAP.get(polarity)
+	if p is None and isinstance(polarity, str):
+		p = _POLARITY_MAP.get(polarity.lower())
+
+	if p is None:
+		return int(polarity)
+	else:
+		return p
+
 
+def _to_list(values: Optional[Sequence]) -> List:
+	if values is None:
+		return []
+	else:
+		return list(values)
 
-class Spectrum(Dictable):
+
+@serde
+@add_attrs_doc
+@attr.s(slots=True, repr=False)
+class Spectrum:
 	"""
 	Agilent CEF Spectrum.
 
@@ -248,87 +306,27 @@ class Spectrum(Dictable):
 	:param rt_ranges: A list of retention time ranges for the mass spectrum.
 	"""
 
-	def __init__(
-			self,
-			spectrum_type: str = '',
-			algorithm: str = '',
-			saturation_limit: int = 0,
-			scans: int = 0,
-			scan_type: str = '',
-			ionisation: str = '',
-			polarity: Union[str, int] = 0,
-			voltage: Union[str, float] = 0.0,
-			device: Optional[Device] = None,
-			peaks: Optional[Sequence[Peak]] = None,
-			rt_ranges: Optional[Sequence["RTRange"]] = None,
-			):
-		super().__init__()
-
-		self.spectrum_type = str(spectrum_type)
-		self.saturation_limit = int(saturation_limit)
-		self.scans = int(scans)
-		self.algorithm = str(algorithm)
-		self.scan_type = str(scan_type)
-		self.ionisation = str(ionisation)
-
-		if isinstance(voltage, str):
-			m = re.match(r"([0-9]+\.?[0-9]*)", voltage)
-			if m is not None and m.group(1):
-				self.voltage = float(m.group(1))
-			else:
-				self.voltage = 0
-		else:
-			self.voltage = float(voltage)
-
-		self.polarity: int
-
-		if polarity in {'+', 1, '1'}:
-			self.polarity = 1
-		elif polarity in {'-', -1, "-1"}:
-			self.polarity = -1
-		elif isinstance(polarity, str) and polarity.lower() == "positive":
-			self.polarity = 1
-		elif isinstance(polarity, str) and polarity.lower() == "negative":
-			self.polarity = -1
-		else:
-			self.polarity = int(polarity)
-
-		self.device = device
-
-		if peaks is None:
-			self.peaks = []
-		else:
-			self.peaks = list(peaks)
-
-		if rt_ranges is None:
-			self.rt_ranges = []
-		else:
-			self.rt_ranges = list(rt_ranges)
-
-	__slots__ = [
-			"spectrum_type",
-			"saturation_limit",
-			"scans",
-			"algorithm",
-			"scan_type",
-			"ionisation",
-			"voltage",
-			"polarity",
-			"device",
-			"peaks",
-			"rt_ranges",
-			]
+	spectrum_type: str = attr.ib(converter=str, default='')
+	algorithm: str = attr.ib(converter=str, default='')
+	saturation_limit: int = attr.ib(converter=int, default=0)
+	scans: int = attr.ib(converter=int, default=0)
+	scan_type: str = attr.ib(converter=str, default='')
+	ionisation: str = attr.ib(converter=str, default='')
+	polarity: int = attr.ib(converter=_to_polarity, default=0)
+	voltage: float = attr.ib(converter=_to_voltage, default=0.0)
+	device: Optional[Device] = attr.ib(default=None)
+	peaks: List[Peak] = attr.ib(converter=_to_list, default=None)
+	rt_ranges: List["RTRange"] = attr.ib(converter=_to_list, default=None)
 
-	@property
-	def __dict__(self):
-		data = {}
-		for key in self.__slots__:
-			data[key] = getattr(self, key)
+	def __iter__(self) -> Iterator[Tuple[str, Any]]:
+		"""
+		Iterate over the attributes of the class.
+		"""
 
-		return data
+		yield from attr.asdict(self, recurse=False).items()
 
 	@classmethod
-	def from_xml(cls, element: lxml.objectify.ObjectifiedElement) -> "Spectrum":
+	def from_xml(cls, element: lxml.etree._Element) -> "Spectrum":
 		"""
 		Construct a :class:`~.Spectrum` object from an XML element.
 
@@ -345,17 +343,19 @@ class Spectrum(Dictable):
 		if "scans" in element.attrib:
 			data["scans"] = element.attrib["scans"]
 
-		data["scan_type"] = element.MSDetails.attrib["scanType"]
-		data["ionisation"] = element.MSDetails.attrib["is"]
-		data["polarity"] = element.MSDetails.attrib['p']
-		if "fv" in element.MSDetails.attrib:
-			data["voltage"] = element.MSDetails.attrib["fv"]
+		details = element.find("MSDetails")
+		data["scan_type"] = details.attrib["scanType"]
+		data["ionisation"] = details.attrib["is"]
+		data["polarity"] = details.attrib['p']
+		if "fv" in details.attrib:
+			data["voltage"] = details.attrib["fv"]
 
-		data["device"] = Device.from_xml(element.Device)
-		data["peaks"] = [Peak.from_xml(p) for p in element.MSPeaks.findall('p')]
+		data["device"] = Device.from_xml(element.find("Device"))
+		data["peaks"] = [Peak.from_xml(p) for p in element.find("MSPeaks").iterchildren('p')]
 
-		if element.findall("RTRanges"):
-			data["rt_ranges"] = [RTRange.from_xml(r) for r in element.RTRanges.findall("RTRange")]
+		rt_ranges = element.find("RTRanges")
+		if rt_ranges is not None:
+			data["rt_ranges"] = [RTRange.from_xml(r) for r in rt_ranges.iterchildren("RTRange")]
 
 		# TODO: <MassCalibration>
 
@@ -369,6 +369,12 @@ class Spectrum(Dictable):
 		return f"<Spectrum({pformat(self.peaks)})>"
 
 
+def _td_minutes(minutes: str) -> datetime.timedelta:
+	# Fast path for RTRange.from_xml: the XML attributes are always plain
+	# numbers, so the isinstance check in make_timedelta is unnecessary.
+	return datetime.timedelta(minutes=float(minutes))
+
+
 @serde
 @add_attrs_doc
 @attr.s(slots=True)
@@ -384,17 +390,15 @@ class RTRange:
 	end: datetime.timedelta = attr.ib(converter=make_timedelta, default=0.0)  # type: ignore
 
 	@classmethod
-	def from_xml(cls, element: lxml.objectify.ObjectifiedElement) -> "RTRange":
+	def from_xml(cls, element: lxml.etree._Element) -> "RTRange":
 		"""
 		Construct ab :class:`~.RTRange` object from an XML element.
 
 		:param element: The ``<RTRange>`` XML element to parse the data from.
 		"""
 
-		start = element.attrib["min"]
-		end = element.attrib["max"]
-
-		return cls(start, end)
+		attrib = element.attrib
+		return cls(_td_minutes(attrib["min"]), _td_minutes(attrib["max"]))
 
 
 # TODO: Subclass these from UserString and UserFloat
@@ -448,6 +452,10 @@ class Flag(str):
 		return bool(str(self)) and bool(self.severity)
 
 
+#: Shared by every Score without a flag, to avoid allocating an empty Flag per score.
+_NO_FLAG = Flag('', 0)
+
+
 @prettify_docstrings
 class Score(float):
 	"""
@@ -458,6 +466,7 @@ class Score(float):
 	:param flag_severity: The severity of the flag.
 	"""
 
+	__slots__ = ("flag", )
 	flag: Flag
 
 	def __copy__(self):
@@ -471,7 +480,11 @@ class Score(float):
 
 	def __new__(cls, score, flag_string: str = '', flag_severity: int = 0) -> "Score":  # noqa: D102
 		obj = super().__new__(cls, float(score))
-		obj.flag = Flag(flag_string, flag_severity)
+
+		if flag_string or flag_severity:
+			obj.flag = Flag(flag_string, flag_severity)
+		else:
+			obj.flag = _NO_FLAG
 
 		return obj
 
@@ -502,46 +515,35 @@ class Score(float):
 		return NotImplemented
 
 
-def parse_compound_scores(element: lxml.objectify.ObjectifiedElement) -> Dict[str, Score]:
+def _parse_scores(element: lxml.etree._Element, tag: str) -> Dict[str, Score]:
+	return {
+			score.attrib["algo"]: Score(
+					score.attrib["score"],
+					score.attrib.get("tgtFlagsString", ''),
+					score.attrib.get("tgtFlagsSeverity", 0),
+					)
+			for score in element.iterchildren(tag)
+			}
+
+
+def parse_compound_scores(element: lxml.etree._Element) -> Dict[str, Score]:
 	"""
 	Parse a ``<CompoundScores>`` element into a mapping of algorithms to scores.
 
 	:param element: a CompoundScores XML element.
 	"""
 
-	compound_scores: Dict[str, Score] = {}
-
-	for score in element.findall("CpdScore"):
-		algo: str = score.attrib["algo"]
-		score = Score(
-				score.attrib["score"],
-				score.attrib.get("tgtFlagsString", ''),
-				score.attrib.get("tgtFlagsSeverity", 0),
-				)
-		compound_scores[algo] = score
-
-	return compound_scores
+	return _parse_scores(element, "CpdScore")
 
 
-def parse_match_scores(element: lxml.objectify.ObjectifiedElement) -> Dict[str, Score]:
+def parse_match_scores(element: lxml.etree._Element) -> Dict[str, Score]:
 	"""
 	Parse a ``<MatchScores>`` element into a mapping of algorithms to scores.
 
 	:param element: a MatchScores XML element.
 	"""
 
-	match_scores: Dict[str, Score] = {}
-
-	for score in element.findall("Match"):
-		algo: str = score.attrib["algo"]
-		score = Score(
-				score.attrib["score"],
-				score.attrib.get("tgtFlagsString", ''),
-				score.attrib.get("tgtFlagsSeverity", 0),
-				)
-		match_scores[algo] = score
-
-	return match_scores
+	return _parse_scores(element, "Match")
 
 
 class LocationDict(TypedDict, total=False):
@@ -555,6 +557,9 @@ class LocationDict(TypedDict, total=False):
 	y: float  #: The height of the peak in the EIC.
 
 
+_LOCATION_CASTS = {'m': float, "rt": float, 'a': int, 'y': int}
+
+
 class _CompoundStrPPrinter(FancyPrinter):
 
 	def _repr(self, object, context, level):  # noqa: A002  # pylint: disable=redefined-builtin
@@ -626,35 +631,28 @@ class Compound(Dictable):
 				)
 
 	@classmethod
-	def from_xml(cls, element: lxml.objectify.ObjectifiedElement) -> "Compound":
+	def from_xml(cls, element: lxml.etree._Element) -> "Compound":
 		"""
 		Construct a :class:`~.Compound` object from an XML element.
 
 		:param element: a Compound XML element from a CEF file.
 		"""
 
-		location: LocationDict = {}
-		if 'm' in element.Location.attrib:
-			location['m'] = float(element.Location.attrib['m'])
-		if "rt" in element.Location.attrib:
-			location["rt"] = float(element.Location.attrib["rt"])
-		if 'a' in element.Location.attrib:
-			location['a'] = int(element.Location.attrib['a'])
-		if 'y' in element.Location.attrib:
-			location['y'] = int(element.Location.attrib['y'])
+		location: LocationDict = {
+				key: _LOCATION_CASTS[key](value)  # type: ignore
+				for key,
+				value in element.find("Location").attrib.items()
+				if key in _LOCATION_CASTS
+				}
 
-		results: List[Molecule] = []
-		for molecule in element.Results.findall("Molecule"):
-			results.append(Molecule.from_xml(molecule))
+		results: List[Molecule] = [Molecule.from_xml(molecule) for molecule in element.find("Results").iterchildren("Molecule")]
 
-		spectra: List[Spectrum] = []
-		for spectrum in element.findall("Spectrum"):
-			spectra.append(Spectrum.from_xml(spectrum))
+		spectra: List[Spectrum] = [Spectrum.from_xml(spectrum) for spectrum in element.iterchildren("Spectrum")]
 
 		return cls(
 				algo=element.attrib["algo"],
 				location=location,
-				compound_scores=parse_compound_scores(element.CompoundScores),
+				compound_scores=parse_compound_scores(element.find("CompoundScores")),
 				results=results,
 				spectra=spectra,
 				)
@@ -706,7 +704,7 @@ class CompoundList(NamedList):
 		self.instrument = str(instrument)
 
 	@classmethod
-	def from_xml(cls, element: lxml.objectify.ObjectifiedElement) -> "CompoundList":
+	def from_xml(cls, element: lxml.etree._Element) -> "CompoundList":
 		"""
 		Construct a :class:`~.CompoundList` object from an XML element.
 
@@ -715,7 +713,7 @@ class CompoundList(NamedList):
 
 		return cls(
 				instrument=element.attrib["instrumentConfiguration"],
-				compounds=(Compound.from_xml(compound) for compound in element.findall("Compound")),
+				compounds=(Compound.from_xml(compound) for compound in element.iterchildren("Compound")),
 				)
 
 	def __str__(self) -> str:
@@ -726,16 +724,45 @@ class CompoundList(NamedList):
 		return f"{self.__class__.__name__}{pformat(list(self))}"
 
 
+def iter_cef(filename: PathLike) -> Iterator[Compound]:
+	"""
+	Parse the compounds from the given ``.cef`` file one at a time.
+
+	Unlike :func:`~.parse_cef` this does not hold every :class:`~.Compound` in memory at once;
+	each compound is yielded as soon as its closing tag has been parsed,
+	and that part of the document is then discarded.
+
+	:param filename: The filename of the CEF file to read.
+
+	.. versionadded:: 0.3.0
+	"""
+
+	for _, element in lxml.etree.iterparse(str(filename), events=("end", ), tag="Compound"):
+		yield Compound.from_xml(element)
+		element.clear()
+		while element.getprevious() is not None:
+			del element.getparent()[0]
+
+
 def parse_cef(filename: PathLike) -> CompoundList:
 	"""
 	Construct an :class:`~.CompoundList` object from the given ``.cef`` file.
 
+	The file is parsed incrementally, and each ``<Compound>`` element is discarded
+	once it has been processed, so only a fraction of the document is held in memory at once.
+
 	:param filename: The filename of the CEF file to read.
 	"""
 
-	tree = lxml.objectify.parse(str(filename))
-	root = tree.getroot()
-	version = root.attrib["version"]
-	compounds = CompoundList.from_xml(root.CompoundList)
+	compounds = CompoundList()
+
+	for _, element in lxml.etree.iterparse(str(filename), events=("end", ), tag=("Compound", "CompoundList")):
+		if element.tag == "Compound":
+			compounds.append(Compound.from_xml(element))
+			element.clear()
+			while element.getprevious() is not None:
+				del element.getparent()[0]
+		else:
+			compounds.instrument = str(element.attrib["instrumentConfiguration"])
 
 	return compounds
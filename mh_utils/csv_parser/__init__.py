@@ -34,6 +34,8 @@ Parser for CSV result files produced by MassHunter Qualitative.
 #
 
 # stdlib
+import logging
+from concurrent.futures import ProcessPoolExecutor
 from typing import Iterable
 
 # 3rd party
@@ -44,10 +46,12 @@ from domdf_python_tools.typing import PathLike
 
 # this package
 from mh_utils.csv_parser.classes import Result, Sample, SampleList
-from mh_utils.csv_parser.utils import drop_columns, reorder_columns
+from mh_utils.csv_parser.utils import reorder_columns
 
 __all__ = ["ResultParser", "parse_masshunter_csv", "Result", "SampleList", "Sample"]
 
+logger = logging.getLogger(__name__)
+
 
 class ResultParser:
 	"""
@@ -81,8 +85,8 @@ class ResultParser:
 		infile = self.raw_results_dir / directory / "CSV Results.csv"
 		csv_outfile = self.csv_results_dir / directory / "CSV Results Parsed.csv"
 		json_outfile = self.json_results_dir / directory / "results.json"
-		print(f"{infile} -> {csv_outfile}")
-		print(f"{' ' * len(str(infile))} -> {json_outfile}")
+		logger.info("%s -> %s", infile, csv_outfile)
+		logger.info("%s -> %s", infile, json_outfile)
 
 		parse_masshunter_csv(infile, csv_outfile, json_outfile)
 
@@ -90,12 +94,17 @@ class ResultParser:
 		"""
 		Runs :meth:`.~ResultsParser.parse_for_directory` for each directory in ``directory_list``.
 
+		Each directory is parsed independently, so the work is spread across
+		one worker process per CPU core.
+
 		:param directory_list: A list of directories to process.
 		"""
 
-		for directory in directory_list:
-			print(f"Processing directory {directory}")
-			self.parse_for_directory(directory)
+		directory_list = list(directory_list)
+
+		with ProcessPoolExecutor() as executor:
+			for directory, _ in zip(directory_list, executor.map(self.parse_for_directory, directory_list)):
+				logger.info("Processed directory %s", directory)
 
 
 def parse_masshunter_csv(csv_file: PathLike, csv_outfile: PathLike, json_outfile: PathLike):
@@ -110,18 +119,13 @@ def parse_masshunter_csv(csv_file: PathLike, csv_outfile: PathLike, json_outfile
 	# Read CSV file to data frame
 	results_df = pandas.read_csv(csv_file, header=1, index_col=False, dtype=str)
 
-	# drop unneeded columns
-	drop_columns(results_df)
-
+	# Projecting onto the output column order also drops the unneeded columns,
+	# in a single pandas operation.
 	rearranged_results_df = reorder_columns(results_df)
 	rearranged_results_df.to_csv(csv_outfile, index=False)
 
 	samples = SampleList()
-
-	for row_idx, result in rearranged_results_df.iterrows():
-		sample = samples.add_sample_from_series(result)
-		tmp_result = Result.from_series(result)
-		sample.add_result(tmp_result)
+	samples.add_samples_from_dataframe(rearranged_results_df)
 
 	PathPlus(json_outfile).dump_json(
 			samples,
@@ -29,15 +29,14 @@ Classes to model parts of MassHunter CSV files.
 #
 
 # stdlib
-from collections import OrderedDict
 from decimal import Decimal
-from typing import Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar
 
 # 3rd party
 import numpy
 import pandas  # type: ignore
 import sdjson
-from cawdrey import AlphaDict
 from domdf_python_tools import doctools
 from domdf_python_tools.bases import Dictable
 from domdf_python_tools.doctools import prettify_docstrings
@@ -66,6 +65,37 @@ _SL = TypeVar("_SL", bound="SampleList")
 _R = TypeVar("_R", bound="Result")
 
 
+class _LazyDecimal:
+	"""
+	Non-data descriptor which defers :class:`decimal.Decimal` construction until first access.
+
+	The raw value passed to :meth:`Result.__init__` is kept as-is;
+	the first read converts it and caches the result on the instance,
+	so rows whose numeric fields are never inspected skip the conversion entirely.
+
+	:param name: The name of the attribute on :class:`~.Result`.
+	"""
+
+	def __init__(self, name: str):
+		self.name = name
+
+	def __get__(self, obj, objtype=None):
+		if obj is None:
+			return self
+
+		raw = obj._raw_values[self.name]
+
+		if isinstance(raw, float):
+			# Decimal(float) stores the full binary expansion
+			# (Decimal(0.1) has 55 significant digits); go via the shortest repr instead.
+			value = Decimal(str(raw))
+		else:
+			value = Decimal(raw)
+
+		setattr(obj, self.name, value)
+		return value
+
+
 @prettify_docstrings
 class Sample(Dictable):
 	"""
@@ -83,6 +113,19 @@ class Sample(Dictable):
 	:param results:
 	"""
 
+	#: The CSV column for each parameter of :meth:`~.Sample.__init__`, in order.
+	_SERIES_COLUMNS: Tuple[str, ...] = (
+			"Sample Name",
+			"Sample Type",
+			"Instrument Name",
+			"Position",
+			"User Name",
+			"Acq Method",
+			"DA Method",
+			"IRM Calibration status",
+			"File",
+			)
+
 	def __init__(
 			self,
 			sample_name,
@@ -133,6 +176,11 @@ class Sample(Dictable):
 		else:
 			raise TypeError(f"Unknown type for `results`: {type(results)}")
 
+		# Keep insertion order equal to Cpd order so results_list needn't sort.
+		self._results = dict(sorted(self._results.items()))
+
+		self._by_name_cache: Optional[Dict[str, "Result"]] = None
+
 	def add_result(self, result):
 		"""
 		Add a result to the sample.
@@ -140,8 +188,32 @@ class Sample(Dictable):
 		:param result:
 		"""
 
+		out_of_order = self._results and result.index < next(reversed(self._results))
 		self._results[result.index] = result
 
+		if out_of_order:
+			self._results = dict(sorted(self._results.items()))
+
+		self._by_name_cache = None
+
+	@property
+	def _by_name(self) -> Dict[str, "Result"]:
+		"""
+		Maps compound names to the first result with that name, in ``Cpd`` order.
+
+		Built on first access and invalidated by :meth:`~.Sample.add_result`.
+		"""
+
+		if self._by_name_cache is None:
+			by_name: Dict[str, Result] = {}
+
+			for result in self._results.values():
+				by_name.setdefault(result.name, result)
+
+			self._by_name_cache = by_name
+
+		return self._by_name_cache
+
 	@property
 	def results_list(self) -> List["Result"]:
 		"""
@@ -154,20 +226,23 @@ class Sample(Dictable):
 		.. clearpage::
 		"""
 
-		results_list = []
-
-		for key in sorted(self._results.keys()):
-			results_list.append(self._results[key])
-
-		return results_list
+		return list(self._results.values())
 
 	def __eq__(self, other):
+		if self is other:
+			return True
+
 		if isinstance(other, self.__class__):
 			return (
-					self.sample_name == other.sample_name and self.sample_type == other.sample_type
-					and self.filename == other.filename and self.acq_method == other.acq_method
+					self.filename == other.filename and self.sample_name == other.sample_name
+					and self.sample_type == other.sample_type and self.acq_method == other.acq_method
 					)
 
+		return NotImplemented
+
+	def __hash__(self):
+		return hash((self.filename, self.sample_name))
+
 	@classmethod
 	def from_series(cls: Type[_S], series) -> _S:
 		"""
@@ -202,20 +277,27 @@ class Sample(Dictable):
 	def __repr__(self):
 		return f"Sample({self.sample_name})"
 
+	def to_dict(self) -> Dict:
+		"""
+		Returns a dictionary representation of the :class:`~.Sample`, with the keys in alphabetical order.
+		"""
+
+		return {
+				"acq_method": self.acq_method,
+				"da_method": self.da_method,
+				"filename": self.filename,
+				"instrument_name": self.instrument_name,
+				"irm_cal_status": self.irm_cal_status,
+				"position": self.position,
+				"results": self.results_list,
+				"sample_name": self.sample_name,
+				"sample_type": self.sample_type,
+				"user": self.user,
+				}
+
 	@property
 	def __dict__(self):
-		return AlphaDict(
-				sample_name=self.sample_name,
-				sample_type=self.sample_type,
-				instrument_name=self.instrument_name,
-				position=self.position,
-				user=self.user,
-				acq_method=self.acq_method,
-				da_method=self.da_method,
-				irm_cal_status=self.irm_cal_status,
-				filename=self.filename,
-				results=self.results_list
-				)
+		return self.to_dict()
 
 
 @prettify_docstrings
@@ -266,6 +348,59 @@ class Result(Dictable):
 		\end{multicols}
 	"""
 
+	#: The CSV column for each parameter of :meth:`~.Result.__init__`, in order.
+	_SERIES_COLUMNS: Tuple[str, ...] = (
+			"CAS",
+			"Name",
+			"Hits",
+			"Cpd",
+			"Formula",
+			"Score",
+			"Abund",
+			"Height",
+			"Area",
+			"Diff (Tgt, mDa)",
+			"Diff (Tgt, ppm)",
+			"RT",
+			"Start",
+			"End",
+			"Width",
+			"RT (Tgt)",
+			"RT Diff (Tgt)",
+			"m/z",
+			"m/z (prod.)",
+			"Base Peak",
+			"Mass",
+			"Avg Mass",
+			"Mass (Tgt)",
+			"Mining Algorithm",
+			"Z Count",
+			"Max Z",
+			"Min Z",
+			"Ions",
+			"Polarity",
+			"Label",
+			"Flags (Tgt)",
+			"Flag Severity (Tgt)",
+			"Flag Severity Code (Tgt)",
+			)
+
+	score = _LazyDecimal("score")
+	diff_mDa = _LazyDecimal("diff_mDa")
+	diff_ppm = _LazyDecimal("diff_ppm")
+	rt = _LazyDecimal("rt")
+	start = _LazyDecimal("start")
+	end = _LazyDecimal("end")
+	width = _LazyDecimal("width")
+	tgt_rt = _LazyDecimal("tgt_rt")
+	rt_diff = _LazyDecimal("rt_diff")
+	mz = _LazyDecimal("mz")
+	product_mz = _LazyDecimal("product_mz")
+	base_peak = _LazyDecimal("base_peak")
+	mass = _LazyDecimal("mass")
+	average_mass = _LazyDecimal("average_mass")
+	tgt_mass = _LazyDecimal("tgt_mass")
+
 	def __init__(
 			self,
 			cas,
@@ -307,26 +442,32 @@ class Result(Dictable):
 		# Possible also AL (ID Source) and AM (ID Techniques Applied)
 		self._cas = cas
 		self.name: str = str(name)
+		self._name_cf = self.name.casefold()
 		self.hits = hits
 		self.formula: str = str(formula)
-		self.score: Decimal = Decimal(score)
 		self.abundance: float = int(abundance)
 		self.height: float = int(height)
 		self.area: float = int(area)
-		self.diff_mDa: Decimal = Decimal(diff_mDa)
-		self.diff_ppm: Decimal = Decimal(diff_ppm)
-		self.rt: Decimal = Decimal(rt)
-		self.start: Decimal = Decimal(start)
-		self.end: Decimal = Decimal(end)
-		self.width: Decimal = Decimal(width)
-		self.tgt_rt: Decimal = Decimal(tgt_rt)
-		self.rt_diff: Decimal = Decimal(rt_diff)
-		self.mz: Decimal = Decimal(mz)
-		self.product_mz: Decimal = Decimal(product_mz)
-		self.base_peak: Decimal = Decimal(base_peak)
-		self.mass: Decimal = Decimal(mass)
-		self.average_mass: Decimal = Decimal(average_mass)
-		self.tgt_mass: Decimal = Decimal(tgt_mass)
+
+		# Converted to Decimal on demand by the _LazyDecimal descriptors.
+		self._raw_values = {
+				"score": score,
+				"diff_mDa": diff_mDa,
+				"diff_ppm": diff_ppm,
+				"rt": rt,
+				"start": start,
+				"end": end,
+				"width": width,
+				"tgt_rt": tgt_rt,
+				"rt_diff": rt_diff,
+				"mz": mz,
+				"product_mz": product_mz,
+				"base_peak": base_peak,
+				"mass": mass,
+				"average_mass": average_mass,
+				"tgt_mass": tgt_mass,
+				}
+
 		self.mining_algorithm: str = str(mining_algorithm)
 		self.z_count: int = int(z_count)
 		self.max_z: int = int(max_z)
@@ -422,50 +563,73 @@ class Result(Dictable):
 				flag_severity_code,
 				)
 
+	@classmethod
+	def from_dataframe(cls: Type[_R], df: pandas.DataFrame) -> Iterator[_R]:
+		"""
+		Construct a :class:`~.classes.Result` for each row of ``df``, in row order.
+
+		The columns are extracted once, as numpy arrays,
+		rather than performing a label lookup per row and column.
+
+		:param df:
+		"""
+
+		columns = [df[label].to_numpy() for label in cls._SERIES_COLUMNS]
+
+		for row in zip(*columns):
+			yield cls(*row)
+
 	def __repr__(self):
 		return f"Result({self.name}; {self.formula}; {self.rt}; {self.score})"
 
+	def to_dict(self) -> Dict:
+		"""
+		Returns a dictionary representation of the :class:`~.classes.Result`, with the keys in alphabetical order.
+		"""
+
+		return {
+				"abundance": self.abundance,
+				"area": self.area,
+				"average_mass": self.average_mass,
+				"base_peak": self.base_peak,
+				"cas": self._cas,
+				"diff_mDa": self.diff_mDa,
+				"diff_ppm": self.diff_ppm,
+				"end": self.end,
+				"flag_severity": self.flag_severity,
+				"flag_severity_code": self.flag_severity_code,
+				"flags": self.flags,
+				"formula": self.formula,
+				"height": self.height,
+				"hits": self.hits,
+				"index": self.index,
+				"label": self.label,
+				"mass": self.mass,
+				"max_z": self.max_z,
+				"min_z": self.min_z,
+				"mining_algorithm": self.mining_algorithm,
+				"mz": self.mz,
+				"n_ions": self.n_ions,
+				"name": self.name,
+				"polarity": self.polarity,
+				"product_mz": self.product_mz,
+				"rt": self.rt,
+				"rt_diff": self.rt_diff,
+				"score": self.score,
+				"start": self.start,
+				"tgt_mass": self.tgt_mass,
+				"tgt_rt": self.tgt_rt,
+				"width": self.width,
+				"z_count": self.z_count,
+				}
+
 	@property
 	def __dict__(self):
-		return AlphaDict(
-				cas=self._cas,
-				name=self.name,
-				hits=self.hits,
-				formula=self.formula,
-				score=self.score,
-				abundance=self.abundance,
-				height=self.height,
-				area=self.area,
-				diff_mDa=self.diff_mDa,
-				diff_ppm=self.diff_ppm,
-				rt=self.rt,
-				start=self.start,
-				end=self.end,
-				width=self.width,
-				tgt_rt=self.tgt_rt,
-				rt_diff=self.rt_diff,
-				mz=self.mz,
-				product_mz=self.product_mz,
-				base_peak=self.base_peak,
-				mass=self.mass,
-				average_mass=self.average_mass,
-				tgt_mass=self.tgt_mass,
-				mining_algorithm=self.mining_algorithm,
-				z_count=self.z_count,
-				max_z=self.max_z,
-				min_z=self.min_z,
-				n_ions=self.n_ions,
-				polarity=self.polarity,
-				label=self.label,
-				flags=self.flags,
-				flag_severity=self.flag_severity,
-				flag_severity_code=self.flag_severity_code,
-				index=self.index,
-				)
+		return self.to_dict()
 
 	def __eq__(self, other):
 		if isinstance(other, str):
-			return other.casefold() == self.name.casefold()
+			return other.casefold() == self._name_cf
 		else:
 			return NotImplemented
 
@@ -475,6 +639,45 @@ class SampleList(List[Sample]):
 	A list of :class:`mh_utils.csv_parser.classes.Sample` objects.
 	"""
 
+	def __init__(self, iterable: Iterable[Sample] = ()):
+		super().__init__(iterable)
+		self._by_key: Dict[Tuple, Sample] = {}
+
+		for sample in self:
+			self._by_key.setdefault(self._key(sample), sample)
+
+	@staticmethod
+	def _key(sample: Sample) -> Tuple:
+		# The fields compared by Sample.__eq__, as a hashable lookup key.
+		return sample.sample_name, sample.sample_type, sample.filename, sample.acq_method
+
+	def __reduce__(self):
+		# Rebuild through __init__ when pickling or copying.
+		# The default list reconstruction appends the items before any state is
+		# restored, which would hit the overridden append without ``_by_key``,
+		# and copy.copy would share one ``_by_key`` dict between the copies.
+		return self.__class__, (list(self), )
+
+	def append(self, sample: Sample):
+		"""
+		Append ``sample`` to the end of the list.
+
+		:param sample:
+		"""
+
+		super().append(sample)
+		self._by_key.setdefault(self._key(sample), sample)
+
+	def extend(self, samples: Iterable[Sample]):
+		"""
+		Extend the list by appending the samples from ``samples``.
+
+		:param samples:
+		"""
+
+		for sample in samples:
+			self.append(sample)
+
 	@doctools.append_docstring_from(Sample.__init__)
 	def add_new_sample(self, *args, **kwargs):
 		"""
@@ -497,8 +700,10 @@ class SampleList(List[Sample]):
 		.. clearpage::
 		"""
 
-		if sample in self:
-			return self[self.index(sample)]
+		existing = self._by_key.get(self._key(sample))
+
+		if existing is not None:
+			return existing
 		else:
 			self.append(sample)
 			return sample
@@ -521,6 +726,23 @@ class SampleList(List[Sample]):
 		tmp_sample = Sample.from_series(series)
 		return self.add_sample(tmp_sample)
 
+	def add_samples_from_dataframe(self, df: pandas.DataFrame):
+		"""
+		Create sample and result objects for each row of ``df`` and add them to the list.
+
+		Rows belonging to the same sample are merged.
+		The columns are resolved once for the whole dataframe
+		rather than once per row, as :meth:`~.SampleList.add_sample_from_series` would.
+
+		:param df:
+		"""
+
+		sample_columns = [df[label].to_numpy() for label in Sample._SERIES_COLUMNS]
+
+		for row, result in zip(zip(*sample_columns), Result.from_dataframe(df)):
+			sample = self.add_sample(Sample(*row))
+			sample.add_result(result)
+
 	def sort_samples(self, key: str, reverse: bool = False):
 		"""
 		Sort the list of :class:`~.Samples` in place.
@@ -533,7 +755,7 @@ class SampleList(List[Sample]):
 		.. clearpage::
 		"""
 
-		self.sort(key=lambda samp: getattr(samp, key), reverse=reverse)
+		self.sort(key=attrgetter(key), reverse=reverse)
 
 	def reorder_samples(self, order_mapping: Dict, key: str = "sample_name"):
 		"""
@@ -554,7 +776,15 @@ class SampleList(List[Sample]):
 		:param key: The name of the property in the sample to sort by.
 		"""
 
-		self.sort(key=lambda s: order_mapping[getattr(s, key)], reverse=True)
+		kf = attrgetter(key)
+
+		# Decorate-sort-undecorate, fully built before the list is touched
+		# so a bad key or incomplete mapping cannot leave it half-sorted.
+		# -idx keeps ties in their original order under reverse=True.
+		decorated = [(order_mapping[kf(sample)], -idx, sample) for idx, sample in enumerate(self)]
+		decorated.sort(reverse=True)
+
+		self[:] = [sample for position, neg_idx, sample in decorated]
 
 	def rename_samples(self, rename_mapping: Dict, key: str = "sample_name"):
 		r"""
@@ -577,15 +807,25 @@ class SampleList(List[Sample]):
 				}
 		"""
 
+		kf = attrgetter(key)
+
 		for sample in self:
-			if getattr(sample, key) in rename_mapping and rename_mapping[getattr(sample, key)]:
-				sample.sample_name = rename_mapping.pop(getattr(sample, key))
+			new_name = rename_mapping.get(kf(sample))
+
+			if new_name:
+				sample.sample_name = new_name
+
+		# The sample names form part of the lookup keys.
+		self._by_key = {}
+
+		for sample in self:
+			self._by_key.setdefault(self._key(sample), sample)
 
 	def get_areas_and_scores(
 			self,
 			compound_name: str,
 			include_none: bool = False,
-			) -> Tuple[OrderedDict, OrderedDict]:
+			) -> Tuple[Dict, Dict]:
 		"""
 		Returns two dictionaries: one containing sample names and peak areas for the
 		compound with the given name, the other containing sample names and scores.
@@ -595,23 +835,22 @@ class SampleList(List[Sample]):
 			should be included in the results.
 		"""  # noqa: D400
 
-		peak_areas: "OrderedDict[str, Optional[float]]" = OrderedDict()
-		scores: "OrderedDict[str, Optional[Decimal]]" = OrderedDict()
+		peak_areas: Dict[str, Optional[float]] = {}
+		scores: Dict[str, Optional[Decimal]] = {}
 
 		for sample in self:
-			for result in sample.results_list:
-				if result.name == compound_name:
-					peak_areas[sample.sample_name] = result.area
-					scores[sample.sample_name] = result.score
-					break
-			else:
-				if include_none:
-					peak_areas[sample.sample_name] = None
-					scores[sample.sample_name] = None
+			result = sample._by_name.get(compound_name)
+
+			if result is not None:
+				peak_areas[sample.sample_name] = result.area
+				scores[sample.sample_name] = result.score
+			elif include_none:
+				peak_areas[sample.sample_name] = None
+				scores[sample.sample_name] = None
 
 		return peak_areas, scores
 
-	def get_retention_times(self, compound_name: str, include_none: bool = False) -> OrderedDict:
+	def get_retention_times(self, compound_name: str, include_none: bool = False) -> Dict:
 		"""
 		Returns a dictionary containing sample names and retention times for the
 		compound with the given name.
@@ -621,20 +860,19 @@ class SampleList(List[Sample]):
 			should be included in the results.
 		"""  # noqa: D400
 
-		times = OrderedDict()
+		times: Dict[str, float] = {}
 
 		for sample in self:
-			for result in sample.results_list:
-				if result.name == compound_name:
-					times[sample.sample_name] = float(result.rt)
-					break
-			else:
-				if include_none:
-					times[sample.sample_name] = numpy.nan
+			result = sample._by_name.get(compound_name)
+
+			if result is not None:
+				times[sample.sample_name] = float(result.rt)
+			elif include_none:
+				times[sample.sample_name] = numpy.nan
 
 		return times
 
-	def get_peak_areas(self, compound_name: str, include_none: bool = False) -> OrderedDict:
+	def get_peak_areas(self, compound_name: str, include_none: bool = False) -> Dict:
 		"""
 		Returns a dictionary containing sample names and peak areas for the
 		compound with the given name.
@@ -663,6 +901,35 @@ class SampleList(List[Sample]):
 		all_areas, all_scores = self.get_areas_and_scores_for_compounds(compound_names, include_none)
 		return all_areas
 
+	def areas_dataframe(self, compound_names: Optional[Iterable[str]] = None) -> pandas.DataFrame:
+		"""
+		Returns a :class:`pandas.DataFrame` of peak areas, with a row per sample and a column per compound.
+
+		Samples without a peak for a compound hold :data:`numpy.nan`.
+		The areas are written into a single contiguous :class:`numpy.ndarray` buffer,
+		avoiding the nested dictionaries :meth:`~.SampleList.get_areas_for_compounds` builds.
+
+		:param compound_names: The compounds to include.
+			Defaults to every compound in the list, in alphabetical order.
+		"""
+
+		if compound_names is None:
+			compound_names = self.get_compounds()
+		else:
+			compound_names = list(compound_names)
+
+		col_idx = {name: idx for idx, name in enumerate(compound_names)}
+		areas = numpy.full((len(self), len(compound_names)), numpy.nan, dtype=numpy.float64)
+
+		for row, sample in enumerate(self):
+			for name, result in sample._by_name.items():
+				col = col_idx.get(name)
+
+				if col is not None:
+					areas[row, col] = float(result.area)
+
+		return pandas.DataFrame(areas, index=self.sample_names, columns=compound_names)
+
 	def get_areas_and_scores_for_compounds(
 			self,
 			compound_names: Iterable[str],
@@ -684,17 +951,21 @@ class SampleList(List[Sample]):
 		tmp_all_areas = SamplesAreaDict()
 		tmp_all_scores = SamplesScoresDict()
 
-		for name in compound_names:
-			areas = self.get_peak_areas(name, True)
-			scores = self.get_scores(name, True)
+		compound_names = list(compound_names)
 
-			for sample_name, area in areas.items():
-				if sample_name not in tmp_all_areas:
-					tmp_all_areas[sample_name] = dict()
-					tmp_all_scores[sample_name] = dict()
+		for sample in self:
+			by_name = sample._by_name
 
-				tmp_all_areas[sample_name][name] = area
-				tmp_all_scores[sample_name][name] = scores[sample_name]
+			areas = dict()
+			scores = dict()
+
+			for name in compound_names:
+				result = by_name.get(name)
+				areas[name] = None if result is None else result.area
+				scores[name] = None if result is None else result.score
+
+			tmp_all_areas[sample.sample_name] = areas
+			tmp_all_scores[sample.sample_name] = scores
 
 		if include_none:
 			return tmp_all_areas, tmp_all_scores
@@ -704,7 +975,7 @@ class SampleList(List[Sample]):
 			all_scores = SamplesScoresDict()
 
 			for sample_name, compound_areas in tmp_all_areas.items():
-				if any(list(compound_areas.values())):
+				if any(compound_areas.values()):
 					all_areas[sample_name] = compound_areas
 					all_scores[sample_name] = tmp_all_scores[sample_name]
 
@@ -715,15 +986,14 @@ class SampleList(List[Sample]):
 		Returns a list containing the names of the compounds present in the samples in alphabetical order.
 		"""
 
-		compounds = set()
+		compounds: set = set()
 
 		for sample in self:
-			for result in sample.results_list:
-				compounds.add(result.name)
+			compounds.update(sample._by_name)
 
 		return sorted(compounds)
 
-	def get_scores(self, compound_name: str, include_none: bool = False) -> OrderedDict:
+	def get_scores(self, compound_name: str, include_none: bool = False) -> Dict:
 		"""
 		Returns a dictionary containing sample names and scores for the
 		compound with the given name.
@@ -754,17 +1024,16 @@ class SampleList(List[Sample]):
 			will be excluded from the output, rather than included.
 		"""
 
-		new_sample_list = self.__class__()
+		sample_names = frozenset(sample_names)
+		kf = attrgetter(key)
 
-		for sample in self:
-			if exclude:
-				if getattr(sample, key) in sample_names:
-					continue
-			else:
-				if getattr(sample, key) not in sample_names:
-					continue
+		if exclude:
+			picked = [sample for sample in self if kf(sample) not in sample_names]
+		else:
+			picked = [sample for sample in self if kf(sample) in sample_names]
 
-			new_sample_list.append(sample)
+		new_sample_list = self.__class__()
+		new_sample_list.extend(picked)
 
 		return new_sample_list
 
@@ -796,9 +1065,9 @@ class SampleList(List[Sample]):
 		return all_samples
 
 
-class BaseSamplePropertyDict(OrderedDict):
+class BaseSamplePropertyDict(dict):
 	"""
-	OrderedDict to store a single property of a set of samples.
+	Dictionary to store a single property of a set of samples.
 
 	Keys are the sample names and the values are dictionaries mapping compound names to property values.
 	"""
@@ -809,7 +1078,7 @@ class BaseSamplePropertyDict(OrderedDict):
 		Returns a list of sample names in the :class:`~.BaseSamplePropertyDict`.
 		"""
 
-		return list(self.keys())
+		return [*self]
 
 	@property
 	def n_samples(self) -> int:
@@ -832,7 +1101,7 @@ class BaseSamplePropertyDict(OrderedDict):
 
 class SamplesAreaDict(BaseSamplePropertyDict):
 	"""
-	:class:`collections.OrderedDict` to store area information parsed from MassHunter results CSV files.
+	:class:`dict` to store area information parsed from MassHunter results CSV files.
 	"""
 
 	def get_compound_areas(self, compound_name: str) -> List[float]:
@@ -844,20 +1113,17 @@ class SamplesAreaDict(BaseSamplePropertyDict):
 
 		areas = []
 
-		for sample_name, compound_areas in self.items():
-			for name, area in compound_areas.items():
-				if compound_name == name:
-					if area is None:
-						areas.append(0.0)
-					else:
-						areas.append(area)
+		for compound_areas in self.values():
+			if compound_name in compound_areas:
+				area = compound_areas[compound_name]
+				areas.append(0.0 if area is None else area)
 
 		return areas
 
 
 class SamplesScoresDict(BaseSamplePropertyDict):
 	"""
-	:class:`collections.OrderedDict` to store score information parsed from MassHunter results CSV files.
+	:class:`dict` to store score information parsed from MassHunter results CSV files.
 	"""
 
 	def get_compound_scores(self, compound_name: str) -> List[float]:
@@ -869,13 +1135,10 @@ class SamplesScoresDict(BaseSamplePropertyDict):
 
 		scores = []
 
-		for sample_name, compound_scores in self.items():
-			for name, score in compound_scores.items():
-				if compound_name == name:
-					if score is None:
-						scores.append(0.0)
-					else:
-						scores.append(score)
+		for compound_scores in self.values():
+			if compound_name in compound_scores:
+				score = compound_scores[compound_name]
+				scores.append(0.0 if score is None else score)
 
 		return scores
 
@@ -883,7 +1146,7 @@ class SamplesScoresDict(BaseSamplePropertyDict):
 @sdjson.encoders.register(Sample)
 @sdjson.encoders.register(Result)
 def encode_result_or_sample(obj):  # noqa: D103
-	return dict(obj)
+	return obj.to_dict()
 
 
 @sdjson.encoders.register(set)
@@ -34,6 +34,7 @@ from typing import List, Optional, Tuple
 
 # 3rd party
 import attr
+import numpy  # type: ignore
 from attr_utils.serialise import serde
 from chemistry_tools.formulae import Formula
 from chemistry_tools.names import get_IUPAC_sort_order
@@ -121,24 +122,14 @@ class PCDLCompound:
 		Returns the :class:`~.PCDLCompound` as a list.
 		"""
 
-		row: List[str] = [self.name, self.cas or '', self.iupac_name]
-
-		if self.formula:
-			row.append(self.formula.hill_formula)
-		else:
-			row.append('')
-
-		if self.exact_mass:
-			row.append(str(self.exact_mass))
-		else:
-			row.append('')
-
-		if self.pubchem_id:
-			row.append(str(self.pubchem_id))
-		else:
-			row.append('')
-
-		return row
+		return [
+				self.name,
+				self.cas or '',
+				self.iupac_name,
+				self.formula.hill_formula if self.formula else '',
+				str(self.exact_mass) if self.exact_mass else '',
+				str(self.pubchem_id) if self.pubchem_id else '',
+				]
 
 
 def compound_list_2_pandas(compound_list: List[PCDLCompound]) -> DataFrame:
@@ -152,14 +143,16 @@ def compound_list_2_pandas(compound_list: List[PCDLCompound]) -> DataFrame:
 	.. versionadded:: 0.2.0
 	"""
 
-	columns = ["Name", "CAS", "IUPAC", "Formula", "Mass", "PubChem"]
-	data: List[List[str]] = []
-
-	for compound in compound_list:
-		if compound.formula:
-			data.append(compound.as_list())
+	compounds = [compound for compound in compound_list if compound.formula]
 
-	df = DataFrame(data, columns=columns)
+	df = DataFrame({
+			"Name": [compound.name for compound in compounds],
+			"CAS": [compound.cas or '' for compound in compounds],
+			"IUPAC": [compound.iupac_name for compound in compounds],
+			"Formula": [compound.formula.hill_formula for compound in compounds],  # type: ignore
+			"Mass": [str(compound.exact_mass) if compound.exact_mass else '' for compound in compounds],
+			"PubChem": [str(compound.pubchem_id) if compound.pubchem_id else '' for compound in compounds],
+			})
 	df = df.reindex([
 			"Name",
 			"Formula",
@@ -180,7 +173,9 @@ def compound_list_2_pandas(compound_list: List[PCDLCompound]) -> DataFrame:
 
 	names = df["IUPAC"]
 	sort_order = get_IUPAC_sort_order(names)
-	df = df.loc[df["IUPAC"].map(sort_order).sort_values(ascending=True).index]
+	order = numpy.fromiter((sort_order[name] for name in names), dtype=numpy.int64, count=len(names))
+	# quicksort matches the tie ordering of the Series.sort_values call this replaces.
+	df = df.iloc[numpy.argsort(order, kind="quicksort")]
 
 	return df
 
@@ -31,13 +31,11 @@ General utility functions.
 
 # stdlib
 import datetime
+import functools
 import pathlib
 import re
 from typing import Any, Optional, Union
 
-# 3rd party
-from domdf_python_tools.utils import strtobool
-
 __all__ = [
 		"as_path",
 		"element_to_bool",
@@ -46,6 +44,33 @@ __all__ = [
 		"make_timedelta",
 		]
 
+_camel_boundary_re = re.compile("(.)([A-Z][a-z]+)")
+_snake_boundary_re = re.compile("([a-z0-9])([A-Z])")
+
+_truth_values = {
+		"-1": True,
+		'y': True,
+		"yes": True,
+		't': True,
+		"true": True,
+		"on": True,
+		'1': True,
+		'n': False,
+		"no": False,
+		'f': False,
+		"false": False,
+		"off": False,
+		'0': False,
+		}
+
+
+@functools.lru_cache(maxsize=1024)
+def _make_windows_path(val: str) -> pathlib.PureWindowsPath:
+	# Parsing a path string is surprisingly expensive, and worklists repeat
+	# the same method/results paths for every job; PureWindowsPath is
+	# immutable so the instances can be shared.
+	return pathlib.PureWindowsPath(val)
+
 
 def as_path(val: Any) -> Optional[pathlib.PureWindowsPath]:
 	"""
@@ -61,7 +86,7 @@ def as_path(val: Any) -> Optional[pathlib.PureWindowsPath]:
 	val = str(val).strip()
 
 	if val:
-		return pathlib.PureWindowsPath(val)
+		return _make_windows_path(val)
 	else:
 		return None
 
@@ -79,22 +104,27 @@ def element_to_bool(val: Union[str, bool]) -> bool:
 	:raises: :py:exc:`ValueError` if 'val' is anything else.
 	"""
 
-	val = str(val).strip()
-	if val == "-1":
-		return True
-	else:
-		return bool(strtobool(val))
+	val = str(val).strip().lower()
 
+	try:
+		return _truth_values[val]
+	except KeyError:
+		raise ValueError(f"invalid truth value {val!r}") from None
 
+
+@functools.lru_cache(maxsize=1024)
 def camel_to_snake(name: str) -> str:
 	"""
 	Convert ``name`` from ``CamelCase`` to ``snake_case``.
 
+	Results are cached, as the same small set of tag names
+	tends to be converted over and over when parsing a file.
+
 	:param name: The ``CamelCase`` string to convert to ``snake_case``.
 	"""
 
-	name = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-	name = re.sub("([a-z0-9])([A-Z])", r"\1_\2", name)
+	name = _camel_boundary_re.sub(r"\1_\2", name)
+	name = _snake_boundary_re.sub(r"\1_\2", name)
 	return name.lower()
 
 
@@ -105,6 +135,9 @@ def strip_string(val: str) -> str:
 	:param val:
 	"""
 
+	if isinstance(val, str):
+		return val.strip()
+
 	return str(val).strip()
 
 
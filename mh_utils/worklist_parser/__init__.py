@@ -31,9 +31,6 @@ The other functions and classes must be imported from submodules of this package
 #  OR OTHER DEALINGS IN THE SOFTWARE.
 #
 
-# stdlib
-import os
-
 # 3rd party
 from domdf_python_tools.typing import PathLike
 
@@ -48,9 +45,8 @@ def read_worklist(filename: PathLike) -> Worklist:
 	Read the worklist from the given file.
 
 	:param filename: The filename of the worklist.
-	"""
 
-	if not os.path.isfile(filename):
-		raise FileNotFoundError(f"'{filename}' does not exist.")
+	:raises FileNotFoundError: if the file does not exist.
+	"""
 
 	return Worklist.from_xml_file(filename)
@@ -34,6 +34,7 @@ from uuid import UUID
 # 3rd party
 import attr
 import lxml.etree  # type: ignore
+import numpy  # type: ignore
 import pandas  # type: ignore
 from attr_utils.docstrings import add_attrs_doc
 from attr_utils.serialise import serde
@@ -74,6 +75,8 @@ class JobData(Dictable):
 
 		if isinstance(id, UUID):
 			self.id = id
+		elif isinstance(id, str):
+			self.id = UUID(id)
 		else:
 			self.id = UUID(str(id))
 
@@ -114,18 +117,18 @@ class JobData(Dictable):
 
 	@property
 	def __dict__(self):
-		data = {}
-		for key in self.__slots__:
-			if key == "id":
-				data[key] = str(self.id)
-			else:
-				data[key] = getattr(self, key)
-
-		return data
+		return {
+				"id": str(self.id),
+				"job_type": self.job_type,
+				"run_status": self.run_status,
+				"sample_info": self.sample_info,
+				}
 
 	def __repr__(self) -> str:
-		values = ", ".join(f"{key}={val!r}" for key, val in iter(self) if key != "sample_info")
-		return f"{self.__class__.__name__}({values})"
+		return (
+				f"{self.__class__.__name__}("
+				f"id={str(self.id)!r}, job_type={self.job_type!r}, run_status={self.run_status!r})"
+				)
 
 
 @prettify_docstrings
@@ -233,19 +236,17 @@ class Worklist(XMLFileMixin, Dictable):
 		"""
 
 		headers = [col for col in columns] + [col for col in self.user_columns]
-		data = []
-
-		for job in self.jobs:
-			row = []
+		data = numpy.empty((len(self.jobs), len(headers)), dtype=object)
 
-			for header_label in headers:
-				row.append(job.sample_info[header_label])
-
-			data.append(row)
+		for row_idx, job in enumerate(self.jobs):
+			sample_info = job.sample_info
+			data[row_idx] = [sample_info[header_label] for header_label in headers]
 
 		# TODO: Sort columns by "reorder_id"
 
-		return pandas.DataFrame(data, columns=headers)
+		# infer_objects gives the numeric columns the same dtypes
+		# pandas would have inferred from a list of rows.
+		return pandas.DataFrame(data, columns=headers).infer_objects()
 
 
 @serde
@@ -319,14 +320,14 @@ class Macro:
 		Returns whether the macro is undefined.
 		"""
 
-		return all([
-				self.project_name == '',
-				self.procedure_name == '',
-				self.input_parameter == '',
-				self.output_data_type == 0,
-				self.output_parameter == '',
-				self.display_string == '',
-				])
+		return (
+				self.project_name == ''
+				and self.procedure_name == ''
+				and self.input_parameter == ''
+				and self.output_data_type == 0
+				and self.output_parameter == ''
+				and self.display_string == ''
+				)
 
 	def __repr__(self) -> str:
 		if self.undefined:
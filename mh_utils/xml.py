@@ -70,7 +70,15 @@ def get_validated_tree(xml_file: PathLike, schema_file: Optional[PathLike] = Non
 
 		schema = etree.XMLSchema(etree.parse(str(schema_file)))
 
-	parser = objectify.makeparser(schema=schema)
+	# Ignorable whitespace, xml:id hashing and entity resolution are not
+	# needed for the machine-generated files parsed here, so skip the work
+	# (and the memory) of tracking them.
+	parser = objectify.makeparser(
+			schema=schema,
+			remove_blank_text=True,
+			collect_ids=False,
+			resolve_entities=False,
+			)
 	tree: _ElementTree = objectify.parse(str(xml_file), parser=parser)
 
 	if schema:
@@ -8,7 +8,18 @@ from domdf_python_tools.paths import PathPlus
 from pytest_regressions.file_regression import FileRegressionFixture
 
 # this package
-from mh_utils.cef_parser import Compound, CompoundList, Device, Molecule, Peak, RTRange, Score, Spectrum, parse_cef
+from mh_utils.cef_parser import (
+		Compound,
+		CompoundList,
+		Device,
+		Molecule,
+		Peak,
+		RTRange,
+		Score,
+		Spectrum,
+		iter_cef,
+		parse_cef
+		)
 
 
 @pytest.fixture()
@@ -269,6 +280,26 @@ def test_parse_cef(tmpdir, expected_compound):
 	assert parse_cef(PathPlus(__file__).parent / "example.cef")
 
 
+@pytest.mark.usefixtures("tof_spectrum", "fbf_spectrum")
+def test_iter_cef(tmpdir, expected_compound):
+	(PathPlus(tmpdir) / "demo.cef").write_text(
+			f"""\
+<?xml version="1.0" encoding="utf-8" standalone="yes"?>
+<CEF version="1.0.0.0">
+<CompoundList instrumentConfiguration="LCQTOF">
+	{raw_xml}
+</CompoundList>
+</CEF>
+"""
+			)
+
+	compounds = iter_cef(PathPlus(tmpdir) / "demo.cef")
+	assert iter(compounds) is compounds
+	assert list(compounds) == [expected_compound]
+
+	assert list(iter_cef(PathPlus(__file__).parent / "example.cef"))
+
+
 def test_compoundlist_repr(expected_compound):
 	compound_list = CompoundList("LCQTOF", [expected_compound])
 
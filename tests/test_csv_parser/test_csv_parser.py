@@ -1,13 +1,16 @@
 # stdlib
+import copy
+import pickle
 import re
 
 # 3rd party
+import numpy  # type: ignore
 from domdf_python_tools.paths import PathPlus
 from mathematical.utils import concatenate_csv
 from pytest_regressions.file_regression import FileRegressionFixture
 
 # this package
-from mh_utils.csv_parser import ResultParser
+from mh_utils.csv_parser import Result, ResultParser, Sample, SampleList
 from mh_utils.csv_parser.utils import concatenate_json
 
 
@@ -50,3 +53,72 @@ def test_csv_parser(tmp_pathplus, file_regression: FileRegressionFixture):
 
 	file_regression.check((tmp_pathplus / "All CSV Results.csv").read_text(), encoding="UTF-8", extension=".csv")
 	file_regression.check((tmp_pathplus / "All Results.json").read_text(), encoding="UTF-8", extension=".json")
+
+
+def _sample_with_areas(sample_name, compounds) -> Sample:
+	sample = Sample(
+			sample_name=sample_name,
+			sample_type="Sample",
+			instrument_name="Instrument 1",
+			position="P1-A1",
+			user="User",
+			acq_method="Method.m",
+			da_method="DA.m",
+			irm_cal_status="Success",
+			filename=f"{sample_name}.d",
+			)
+
+	for index, (name, area) in enumerate(compounds):
+		sample.add_result(Result(cas="0-00-0", name=name, hits=1, index=index, area=area))
+
+	return sample
+
+
+def test_areas_dataframe():
+	samples = SampleList([
+			_sample_with_areas("Sample 1", [("Toluene", 1200), ("Phenol", 250)]),
+			_sample_with_areas("Sample 2", [("Phenol", 500)]),
+			])
+
+	df = samples.areas_dataframe()
+
+	assert df.index.tolist() == ["Sample 1", "Sample 2"]
+	assert df.columns.tolist() == ["Phenol", "Toluene"]
+	assert df.at["Sample 1", "Phenol"] == 250.0
+	assert df.at["Sample 1", "Toluene"] == 1200.0
+	assert df.at["Sample 2", "Phenol"] == 500.0
+	assert numpy.isnan(df.at["Sample 2", "Toluene"])
+
+
+def test_areas_dataframe_compound_names():
+	samples = SampleList([
+			_sample_with_areas("Sample 1", [("Toluene", 1200), ("Phenol", 250)]),
+			_sample_with_areas("Sample 2", [("Phenol", 500)]),
+			])
+
+	df = samples.areas_dataframe(["Toluene", "Benzene"])
+
+	assert df.index.tolist() == ["Sample 1", "Sample 2"]
+	assert df.columns.tolist() == ["Toluene", "Benzene"]
+	assert df.at["Sample 1", "Toluene"] == 1200.0
+	assert numpy.isnan(df.at["Sample 1", "Benzene"])
+	assert numpy.isnan(df.at["Sample 2", "Toluene"])
+	assert numpy.isnan(df.at["Sample 2", "Benzene"])
+
+
+def test_sample_list_pickle_and_copy():
+	samples = SampleList([_sample_with_areas("Sample 1", [("Toluene", 1200)])])
+
+	roundtripped = pickle.loads(pickle.dumps(samples))
+	assert isinstance(roundtripped, SampleList)
+	assert roundtripped == samples
+
+	# The rebuilt lookup index should still deduplicate samples.
+	duplicate = _sample_with_areas("Sample 1", [("Toluene", 1200)])
+	assert roundtripped.add_sample(duplicate) is roundtripped[0]
+
+	# Copies should not share the lookup index.
+	shallow_copy = copy.copy(samples)
+	shallow_copy.append(_sample_with_areas("Sample 2", [("Phenol", 500)]))
+	assert samples.add_sample(duplicate) is samples[0]
+	assert len(samples) == 1
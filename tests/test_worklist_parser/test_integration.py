@@ -34,5 +34,5 @@ def test_integration():
 				],
 		)
 def test_read_worklist_missing_file(xml_file):
-	with pytest.raises(FileNotFoundError, match="'.*' does not exist."):
+	with pytest.raises(FileNotFoundError, match="XML file '.*' not found."):
 		read_worklist(xml_file)